@@ -1,11 +1,11 @@
 
-from typing import Dict, List, Union, Optional, Any
+from typing import Annotated, Dict, List, Union, Optional, Any
 from mcp.server import MCPServer, Tool, Resources
-from pydantic import BaseModel, Field, validator  # You may need to install this: pip install pydantic
+import msgspec  # You may need to install this: pip install msgspec
 import os
 import json
 import asyncio
-import requests  # You may need to install this: pip install requests
+import httpx  # You may need to install this: pip install "httpx[http2]"
 
 # Initialize the MCP server with security options
 server = MCPServer(
@@ -17,36 +17,43 @@ server = MCPServer(
     # }
 )
 
+# Shared HTTP client for outbound API calls. Connections are pooled and kept
+# alive between tool calls, and HTTP/2 multiplexes concurrent calls per host.
+# MCPServer has no shutdown hook to close it from, so the client stays open for
+# the life of the process and its connections are released when the process exits.
+http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    http2=True,
+    timeout=30.0
+)
+
 
 # Parameter validation model for get_github_github_mcp_server_1744571706539_data
-class get_github_github_mcp_server_1744571706539_data_params(BaseModel):
-    query: str = Field(description="The search query to find relevant data") 
-    limit: int = Field(description="Maximum number of results to return") # Customize with: ge=0, le=100, etc.
+class get_github_github_mcp_server_1744571706539_data_params(msgspec.Struct, frozen=True, kw_only=True, forbid_unknown_fields=True):
+    query: Annotated[str, msgspec.Meta(description="The search query to find relevant data")] 
+    limit: Annotated[int, msgspec.Meta(description="Maximum number of results to return")] # Customize with: ge=0, le=100, etc.
     
     # Add custom validation if needed
-    # @validator("field_name")
-    # def validate_field(cls, v):
+    # def __post_init__(self):
     #     if not valid_condition:
     #         raise ValueError("Validation error message")
-    #     return v
 
 @server.tool()
 async def get_github_github_mcp_server_1744571706539_data(query: str, limit: int) -> Dict[str, Any]:
     """Fetches data from the github_github_mcp_server_1744571706539 API"""
     # Validate parameters
-    params = get_github_github_mcp_server_1744571706539_data_params(
-        query=query,
-        limit=limit
-    )
+    params = msgspec.convert({
+        "query": query,
+        "limit": limit
+    }, type=get_github_github_mcp_server_1744571706539_data_params)
     
     # TODO: Implement tool functionality
     
     # IMPLEMENTATION HINTS:
-    # 1. For API calls:
-    # async with aiohttp.ClientSession() as session:
-    #     async with session.get(f"https://api.example.com/data?param={param_name}") as response:
-    #         data = await response.json()
-    #         return {"result": data}
+    # 1. For API calls (reuse the shared http_client rather than opening a new session per call):
+    # response = await http_client.get("https://api.example.com/data", params={"param": param_name})
+    # response.raise_for_status()
+    # return {"result": response.json()}
     
     # 2. For file operations:
     # with open("data.json", "r") as f:
@@ -56,42 +63,45 @@ async def get_github_github_mcp_server_1744571706539_data(query: str, limit: int
     # 3. For database queries (using SQLite as example):
     # import aiosqlite
     # async with aiosqlite.connect("database.db") as db:
-    #     cursor = await db.execute("SELECT * FROM table WHERE column = ?", (param_value,))
-    #     results = await cursor.fetchall()
+    #     await db.execute("PRAGMA journal_mode=WAL")
+    #     await db.execute("PRAGMA synchronous=NORMAL")
+    #     # For reads, execute_fetchall runs the query and fetches its rows in one call
+    #     results = await db.execute_fetchall("SELECT * FROM table WHERE column = ?", (param_value,))
+    #     # For writes, send all rows with one executemany and commit once, so they share
+    #     # a single transaction instead of paying for an execute + commit per row
+    #     await db.executemany("INSERT INTO table (column) VALUES (?)", rows)
+    #     await db.commit()
     #     return {"result": results}
     
     # Example implementation (replace with your actual logic):
     return {"result": f"get_github_github_mcp_server_1744571706539_data executed with parameters: {query}, {limit}"}
 
 # Parameter validation model for search_github_github_mcp_server_1744571706539
-class search_github_github_mcp_server_1744571706539_params(BaseModel):
-    keyword: str = Field(description="The keyword to search for") 
-    filters: Dict[str, Any] = Field(description="Optional filters to apply to the search") 
+class search_github_github_mcp_server_1744571706539_params(msgspec.Struct, frozen=True, kw_only=True, forbid_unknown_fields=True):
+    keyword: Annotated[str, msgspec.Meta(description="The keyword to search for")] 
+    filters: Annotated[Dict[str, Any], msgspec.Meta(description="Optional filters to apply to the search")] 
     
     # Add custom validation if needed
-    # @validator("field_name")
-    # def validate_field(cls, v):
+    # def __post_init__(self):
     #     if not valid_condition:
     #         raise ValueError("Validation error message")
-    #     return v
 
 @server.tool()
 async def search_github_github_mcp_server_1744571706539(keyword: str, filters: Dict[str, Any]) -> Dict[str, Any]:
     """Searches for information in the github_github_mcp_server_1744571706539 database"""
     # Validate parameters
-    params = search_github_github_mcp_server_1744571706539_params(
-        keyword=keyword,
-        filters=filters
-    )
+    params = msgspec.convert({
+        "keyword": keyword,
+        "filters": filters
+    }, type=search_github_github_mcp_server_1744571706539_params)
     
     # TODO: Implement tool functionality
     
     # IMPLEMENTATION HINTS:
-    # 1. For API calls:
-    # async with aiohttp.ClientSession() as session:
-    #     async with session.get(f"https://api.example.com/data?param={param_name}") as response:
-    #         data = await response.json()
-    #         return {"result": data}
+    # 1. For API calls (reuse the shared http_client rather than opening a new session per call):
+    # response = await http_client.get("https://api.example.com/data", params={"param": param_name})
+    # response.raise_for_status()
+    # return {"result": response.json()}
     
     # 2. For file operations:
     # with open("data.json", "r") as f:
@@ -101,8 +111,14 @@ async def search_github_github_mcp_server_1744571706539(keyword: str, filters: D
     # 3. For database queries (using SQLite as example):
     # import aiosqlite
     # async with aiosqlite.connect("database.db") as db:
-    #     cursor = await db.execute("SELECT * FROM table WHERE column = ?", (param_value,))
-    #     results = await cursor.fetchall()
+    #     await db.execute("PRAGMA journal_mode=WAL")
+    #     await db.execute("PRAGMA synchronous=NORMAL")
+    #     # For reads, execute_fetchall runs the query and fetches its rows in one call
+    #     results = await db.execute_fetchall("SELECT * FROM table WHERE column = ?", (param_value,))
+    #     # For writes, send all rows with one executemany and commit once, so they share
+    #     # a single transaction instead of paying for an execute + commit per row
+    #     await db.executemany("INSERT INTO table (column) VALUES (?)", rows)
+    #     await db.commit()
     #     return {"result": results}
     
     # Example implementation (replace with your actual logic):
@@ -9,7 +9,7 @@ python -m venv venv
 source venv/bin/activate  # On Windows, use: venv\Scripts\activate
 
 # Install required dependencies
-pip install mcp-client-sdk pydantic==2.4.2 asyncio aiohttp
+pip install mcp-client-sdk msgspec asyncio "httpx[http2]"
 
 # Install optional but recommended dependencies
 pip install mcp-security mcp-test-suite
@@ -17,9 +17,9 @@ pip install mcp-security mcp-test-suite
 # Create requirements.txt for future reference
 cat > requirements.txt << EOL
 mcp-client-sdk>=0.6.0
-pydantic>=2.4.2
+msgspec>=0.18.0
 asyncio>=3.4.3
-aiohttp>=3.8.5
+httpx[http2]>=0.25.0
 mcp-security>=0.1.0
 mcp-test-suite>=0.3.0
 EOL
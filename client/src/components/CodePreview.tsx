@@ -169,7 +169,7 @@ const CodePreview = ({ serverConfig }: CodePreviewProps) => {
                     <div className="bg-blue-100 text-blue-700 rounded-full w-6 h-6 flex items-center justify-center mr-2">2</div>
                     Parameter Validation
                   </h4>
-                  <p className="text-neutral-600 mb-2">The generated code already includes parameter validation using {serverConfig.serverType === 'python' ? 'Pydantic' : 'Zod'}.</p>
+                  <p className="text-neutral-600 mb-2">The generated code already includes parameter validation using {serverConfig.serverType === 'python' ? 'msgspec' : 'Zod'}.</p>
                   {showHelp && (
                     <div className="bg-neutral-50 p-3 rounded border border-neutral-200 font-mono text-sm">
                       {serverConfig.serverType === 'python' ? (
@@ -49,7 +49,7 @@ const ResultView = ({ generatedServer, onEditServer, onCreateAnother }: ResultVi
         <div className="bg-neutral-50 border border-neutral-200 rounded-lg p-4">
           <h3 className="font-heading font-medium text-lg text-neutral-800 mb-2">Key Features</h3>
           <ul className="list-disc list-inside space-y-1 text-neutral-700 text-sm">
-            <li>Parameter validation with {isTypescript ? 'Zod' : 'Pydantic'}</li>
+            <li>Parameter validation with {isTypescript ? 'Zod' : 'msgspec'}</li>
             <li>Robust error handling</li>
             <li>Authentication support</li>
             <li>Docker configuration</li>
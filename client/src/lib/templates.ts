@@ -63,7 +63,7 @@ const getParamType = (paramType: Parameter['type'], language: 'python' | 'typesc
   }
 };
 
-// Generate constraint validators for Python (Pydantic)
+// Generate msgspec.Meta constraints for Python
 const getPythonConstraints = (param: Parameter): string => {
   if (!param.constraints) return '';
   
@@ -77,11 +77,11 @@ const getPythonConstraints = (param: Parameter): string => {
     case 'url':
       if (c.minLength !== undefined) constraints.push(`min_length=${c.minLength}`);
       if (c.maxLength !== undefined) constraints.push(`max_length=${c.maxLength}`);
-      if (c.pattern) constraints.push(`regex="${c.pattern}"`);
+      if (c.pattern) constraints.push(`pattern="${c.pattern}"`);
       
       // Add format validators
-      if (param.type === 'email') constraints.push(`regex="^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\\.[a-zA-Z0-9-.]+$"`);
-      if (param.type === 'url') constraints.push(`regex="^https?://[^\\s/$.?#].[^\\s]*$"`);
+      if (param.type === 'email') constraints.push(`pattern="^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\\.[a-zA-Z0-9-.]+$"`);
+      if (param.type === 'url') constraints.push(`pattern="^https?://[^\\s/$.?#].[^\\s]*$"`);
       break;
       
     case 'number':
@@ -89,25 +89,27 @@ const getPythonConstraints = (param: Parameter): string => {
       if (c.minimum !== undefined) constraints.push(`ge=${c.minimum}`);
       if (c.maximum !== undefined) constraints.push(`le=${c.maximum}`);
       break;
-      
-    case 'enum':
-      if (c.enum && c.enum.length > 0) {
-        const enumValues = c.enum.map(v => `"${v}"`).join(', ');
-        return `, Literal[${enumValues}]`;
-      }
-      break;
   }
   
-  // Add default value if specified
-  if (c.default !== undefined) {
-    if (typeof c.default === 'string') {
-      constraints.push(`default="${c.default}"`);
-    } else {
-      constraints.push(`default=${c.default}`);
-    }
+  return constraints.length ? `, ${constraints.join(', ')}` : '';
+};
+
+// Python struct field type, narrowing enums to a Literal of their values
+const getPythonFieldType = (param: Parameter): string => {
+  if (param.type === 'enum' && param.constraints?.enum && param.constraints.enum.length > 0) {
+    const enumValues = param.constraints.enum.map(v => `"${v}"`).join(', ');
+    return `Literal[${enumValues}]`;
   }
   
-  return constraints.length ? `, ${constraints.join(', ')}` : '';
+  return getParamType(param.type, 'python');
+};
+
+// Python struct field default, if one is specified
+const getPythonDefault = (param: Parameter): string => {
+  const defaultValue = param.constraints?.default;
+  if (defaultValue === undefined) return '';
+  
+  return typeof defaultValue === 'string' ? ` = "${defaultValue}"` : ` = ${defaultValue}`;
 };
 
 // Generate constraint validators for TypeScript (Zod)
@@ -239,13 +241,13 @@ export const pythonTemplate = (serverConfig: ServerConfig): string => {
   const { serverName, description, tools } = serverConfig;
   
   return `
-from typing import Dict, List, Union, Optional, Any
+from typing import Annotated, Dict, List, Union, Optional, Any
 from mcp.server import MCPServer, Tool, Resources
-from pydantic import BaseModel, Field, validator  # You may need to install this: pip install pydantic
+import msgspec  # You may need to install this: pip install msgspec
 import os
 import json
 import asyncio
-import requests  # You may need to install this: pip install requests
+import httpx  # You may need to install this: pip install "httpx[http2]"
 
 # Initialize the MCP server with security options
 server = MCPServer(
@@ -257,6 +259,16 @@ server = MCPServer(
     # }
 )
 
+# Shared HTTP client for outbound API calls. Connections are pooled and kept
+# alive between tool calls, and HTTP/2 multiplexes concurrent calls per host.
+# MCPServer has no shutdown hook to close it from, so the client stays open for
+# the life of the process and its connections are released when the process exits.
+http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    http2=True,
+    timeout=30.0
+)
+
 ${tools.map(tool => {
   // Create parameter models for validation
   const hasParams = tool.parameters && tool.parameters.length > 0;
@@ -275,21 +287,19 @@ ${tools.map(tool => {
     
     paramModel = `${specialImports.length ? specialImports.join('\n') : ''}
 # Parameter validation model for ${tool.name}
-class ${paramModelName}(BaseModel):
+class ${paramModelName}(msgspec.Struct, frozen=True, kw_only=True, forbid_unknown_fields=True):
     ${tool.parameters.map(p => {
-      const paramType = getParamType(p.type, 'python');
-      // Generate constraints for Pydantic
+      const paramType = getPythonFieldType(p);
+      // Generate constraints for msgspec
       const constraints = getPythonConstraints(p);
       
-      return `${p.name.replace(/\s+/g, '_').toLowerCase()}: ${paramType} = Field(description="${p.description}"${constraints})`;
+      return `${p.name.replace(/\s+/g, '_').toLowerCase()}: Annotated[${paramType}, msgspec.Meta(description="${p.description}"${constraints})]${getPythonDefault(p)}`;
     }).join('\n    ')}
     
     # Add custom validation if needed
-    # @validator("field_name")
-    # def validate_field(cls, v):
+    # def __post_init__(self):
     #     if not valid_condition:
     #         raise ValueError("Validation error message")
-    #     return v
 `;
   }
   
@@ -298,18 +308,17 @@ class ${paramModelName}(BaseModel):
 async def ${tool.name.replace(/\s+/g, '_').toLowerCase()}(${formatParameters(tool.parameters, 'python')}) -> Dict[str, Any]:
     """${tool.description}"""
     # Validate parameters
-${hasParams ? `    params = ${paramModelName}(
-        ${tool.parameters.map(p => `${p.name.replace(/\s+/g, '_').toLowerCase()}=${p.name.replace(/\s+/g, '_').toLowerCase()}`).join(',\n        ')}
-    )` : '    # No parameters to validate'}
+${hasParams ? `    params = msgspec.convert({
+        ${tool.parameters.map(p => `"${p.name.replace(/\s+/g, '_').toLowerCase()}": ${p.name.replace(/\s+/g, '_').toLowerCase()}`).join(',\n        ')}
+    }, type=${paramModelName})` : '    # No parameters to validate'}
     
     # TODO: Implement tool functionality
     
     # IMPLEMENTATION HINTS:
-    # 1. For API calls:
-    # async with aiohttp.ClientSession() as session:
-    #     async with session.get(f"https://api.example.com/data?param={param_name}") as response:
-    #         data = await response.json()
-    #         return {"result": data}
+    # 1. For API calls (reuse the shared http_client rather than opening a new session per call):
+    # response = await http_client.get("https://api.example.com/data", params={"param": param_name})
+    # response.raise_for_status()
+    # return {"result": response.json()}
     
     # 2. For file operations:
     # with open("data.json", "r") as f:
@@ -319,8 +328,14 @@ ${hasParams ? `    params = ${paramModelName}(
     # 3. For database queries (using SQLite as example):
     # import aiosqlite
     # async with aiosqlite.connect("database.db") as db:
-    #     cursor = await db.execute("SELECT * FROM table WHERE column = ?", (param_value,))
-    #     results = await cursor.fetchall()
+    #     await db.execute("PRAGMA journal_mode=WAL")
+    #     await db.execute("PRAGMA synchronous=NORMAL")
+    #     # For reads, execute_fetchall runs the query and fetches its rows in one call
+    #     results = await db.execute_fetchall("SELECT * FROM table WHERE column = ?", (param_value,))
+    #     # For writes, send all rows with one executemany and commit once, so they share
+    #     # a single transaction instead of paying for an execute + commit per row
+    #     await db.executemany("INSERT INTO table (column) VALUES (?)", rows)
+    #     await db.commit()
     #     return {"result": results}
     
     # Example implementation (replace with your actual logic):
@@ -648,7 +663,7 @@ mcp-test validate --server python server.py --spec mcp-1.2.0
 
 This server is pre-configured with tool definitions and includes:
 
-1. **Schema Validation**: Parameter validation using Zod (TypeScript) or Pydantic (Python)
+1. **Schema Validation**: Parameter validation using Zod (TypeScript) or msgspec (Python)
 2. **Error Handling**: Built-in error handling for graceful failure
 3. **Security Options**: API key authentication
 4. **Middleware Support**: For logging, auth verification, etc.
@@ -804,7 +819,7 @@ python -m venv venv
 source venv/bin/activate  # On Windows, use: venv\\Scripts\\activate
 
 # Install required dependencies
-pip install mcp-client-sdk pydantic==2.4.2 asyncio aiohttp
+pip install mcp-client-sdk msgspec asyncio "httpx[http2]"
 
 # Install optional but recommended dependencies
 pip install mcp-security mcp-test-suite
@@ -812,9 +827,9 @@ pip install mcp-security mcp-test-suite
 # Create requirements.txt for future reference
 cat > requirements.txt << EOL
 mcp-client-sdk>=0.6.0
-pydantic>=2.4.2
+msgspec>=0.18.0
 asyncio>=3.4.3
-aiohttp>=3.8.5
+httpx[http2]>=0.25.0
 mcp-security>=0.1.0
 mcp-test-suite>=0.3.0
 EOL
@@ -7,305 +7,383 @@ It follows the Model Context Protocol (MCP) specification.
 """
 
 import os
-import json
+import stat
+import asyncio
+import functools
 import mimetypes
 import base64
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import parse_qs, urlparse
+
+import aiofiles  # You may need to install this: pip install aiofiles
+import aiofiles.os
+import orjson  # You may need to install this: pip install orjson
+import uvicorn  # You may need to install this: pip install "uvicorn[standard]"
+from starlette.applications import Starlette  # You may need to install this: pip install starlette
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
 
 # Server configuration
 HOST = "0.0.0.0"
 PORT = 8000
 ALLOWED_DIRS = [os.path.expanduser("~"), "/tmp"]  # Directories that can be browsed
 MAX_FILE_SIZE = 1024 * 1024  # 1MB max file size for reading
+READ_BLOCK_SIZE = 48 * 1024  # Multiple of 3 so base64 blocks concatenate without padding
+KEEP_ALIVE_TIMEOUT = 75  # Seconds an idle client connection stays open for reuse
+WORKERS = int(os.environ.get("WEB_CONCURRENCY", 1))  # Server processes, each running its own event loop
 
-class MCPServer(BaseHTTPRequestHandler):
-    def _set_headers(self, content_type="application/json"):
-        self.send_response(200)
-        self.send_header("Content-Type", content_type)
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
-        self.end_headers()
-
-    def do_OPTIONS(self):
-        self._set_headers()
-
-    def do_GET(self):
-        """Handle GET requests - serves the MCP manifest"""
-        if self.path == "/" or self.path == "":
-            self._set_headers()
-            manifest = {
-                "protocol": {
-                    "schema": "mcp",
-                    "version": "0.1.0"
-                },
-                "server": {
-                    "name": "File Browser MCP Server",
-                    "version": "1.0.0",
-                    "description": "Browse and access files on the host system",
-                    "vendor": "MCP Server Builder",
-                    "host": f"{HOST}:{PORT}"
-                },
-                "tools": [
-                    {
-                        "name": "list_directory",
-                        "description": "List files and directories in a specified path",
-                        "parameters": [
-                            {
-                                "name": "path",
-                                "description": "Directory path to list",
-                                "type": "string",
-                                "required": True
-                            }
-                        ]
-                    },
-                    {
-                        "name": "read_file",
-                        "description": "Read the contents of a file",
-                        "parameters": [
-                            {
-                                "name": "path",
-                                "description": "File path to read",
-                                "type": "string",
-                                "required": True
-                            }
-                        ]
-                    },
-                    {
-                        "name": "get_file_info",
-                        "description": "Get metadata about a file",
-                        "parameters": [
-                            {
-                                "name": "path",
-                                "description": "File path to analyze",
-                                "type": "string",
-                                "required": True
-                            }
-                        ]
-                    }
-                ]
-            }
-            self.wfile.write(json.dumps(manifest).encode())
-        else:
-            self.send_error(404, "Not Found")
-
-    def do_POST(self):
-        """Handle POST requests - execute the requested tool"""
-        content_length = int(self.headers["Content-Length"])
-        post_data = self.rfile.read(content_length).decode("utf-8")
-        
-        try:
-            params = json.loads(post_data)
-        except json.JSONDecodeError:
-            self.send_error(400, "Invalid JSON")
-            return
-        
-        tool_path = self.path.strip("/")
-        
-        if tool_path == "list_directory":
-            self._handle_list_directory(params)
-        elif tool_path == "read_file":
-            self._handle_read_file(params)
-        elif tool_path == "get_file_info":
-            self._handle_get_file_info(params)
-        else:
-            self.send_error(404, "Tool not found")
-    
-    def _is_path_allowed(self, path):
-        """Check if the path is within allowed directories"""
-        path = os.path.abspath(path)
-        return any(path.startswith(allowed_dir) for allowed_dir in ALLOWED_DIRS)
-    
-    def _handle_list_directory(self, params):
-        """Handle the list_directory tool"""
-        if "path" not in params:
-            self.send_error(400, "Path parameter is required")
-            return
-        
-        path = params["path"]
-        
-        if not self._is_path_allowed(path):
-            self._set_headers()
-            self.wfile.write(json.dumps({
-                "error": "Path not allowed",
-                "allowed_dirs": ALLOWED_DIRS
-            }).encode())
-            return
-        
-        try:
-            entries = os.listdir(path)
-            result = []
-            
-            for entry in entries:
-                full_path = os.path.join(path, entry)
-                try:
-                    stat_info = os.stat(full_path)
-                    entry_type = "directory" if os.path.isdir(full_path) else "file"
-                    
-                    result.append({
-                        "name": entry,
-                        "type": entry_type,
-                        "size": stat_info.st_size,
-                        "modified": stat_info.st_mtime,
-                        "path": full_path
-                    })
-                except (PermissionError, FileNotFoundError):
-                    # Skip entries we can't access
-                    pass
-            
-            self._set_headers()
-            self.wfile.write(json.dumps({
-                "path": path,
-                "entries": result,
-                "count": len(result)
-            }).encode())
-        except (FileNotFoundError, NotADirectoryError):
-            self._set_headers()
-            self.wfile.write(json.dumps({
-                "error": "Directory not found or not a directory",
-                "path": path
-            }).encode())
-        except PermissionError:
-            self._set_headers()
-            self.wfile.write(json.dumps({
-                "error": "Permission denied",
-                "path": path
-            }).encode())
-    
-    def _handle_read_file(self, params):
-        """Handle the read_file tool"""
-        if "path" not in params:
-            self.send_error(400, "Path parameter is required")
-            return
-        
-        path = params["path"]
-        
-        if not self._is_path_allowed(path):
-            self._set_headers()
-            self.wfile.write(json.dumps({
-                "error": "Path not allowed",
-                "allowed_dirs": ALLOWED_DIRS
-            }).encode())
-            return
-        
-        try:
-            # Check file size before reading
-            file_size = os.path.getsize(path)
-            if file_size > MAX_FILE_SIZE:
-                self._set_headers()
-                self.wfile.write(json.dumps({
-                    "error": "File too large to read",
-                    "path": path,
-                    "size": file_size,
-                    "max_size": MAX_FILE_SIZE
-                }).encode())
-                return
-            
-            mime_type, _ = mimetypes.guess_type(path)
-            is_binary = mime_type and not mime_type.startswith(('text/', 'application/json'))
-            
-            with open(path, 'rb' if is_binary else 'r') as f:
-                content = f.read()
-            
-            if is_binary:
-                # For binary files, base64 encode the content
-                content_base64 = base64.b64encode(content).decode('utf-8')
-                self._set_headers()
-                self.wfile.write(json.dumps({
-                    "path": path,
-                    "content_type": mime_type or "application/octet-stream",
-                    "encoding": "base64",
-                    "size": file_size,
-                    "content": content_base64
-                }).encode())
-            else:
-                # For text files, return as-is
-                if isinstance(content, bytes):
-                    content = content.decode('utf-8', errors='replace')
-                self._set_headers()
-                self.wfile.write(json.dumps({
-                    "path": path,
-                    "content_type": mime_type or "text/plain",
-                    "encoding": "utf-8",
-                    "size": file_size,
-                    "content": content
-                }).encode())
-                
-        except FileNotFoundError:
-            self._set_headers()
-            self.wfile.write(json.dumps({
-                "error": "File not found",
-                "path": path
-            }).encode())
-        except PermissionError:
-            self._set_headers()
-            self.wfile.write(json.dumps({
-                "error": "Permission denied",
-                "path": path
-            }).encode())
-        except IsADirectoryError:
-            self._set_headers()
-            self.wfile.write(json.dumps({
-                "error": "Path is a directory, not a file",
-                "path": path
-            }).encode())
-    
-    def _handle_get_file_info(self, params):
-        """Handle the get_file_info tool"""
-        if "path" not in params:
-            self.send_error(400, "Path parameter is required")
+# Resolved allowed directories, each ending in a separator so "/tmp" does not match "/tmp-other"
+_ALLOWED_REAL = tuple(os.path.join(os.path.realpath(d), "") for d in ALLOWED_DIRS)
+
+# Headers added to every HTTP response
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET, POST, OPTIONS"),
+    (b"access-control-allow-headers", b"Content-Type"),
+]
+
+class CORSHeadersMiddleware:
+    """Pure ASGI middleware that answers preflight requests and adds CORS headers"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
             return
-        
-        path = params["path"]
-        
-        if not self._is_path_allowed(path):
-            self._set_headers()
-            self.wfile.write(json.dumps({
-                "error": "Path not allowed",
-                "allowed_dirs": ALLOWED_DIRS
-            }).encode())
+
+        if scope["method"] == "OPTIONS":
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", b"0"),
+                    *CORS_HEADERS
+                ]
+            })
+            await send({"type": "http.response.body", "body": b""})
             return
-        
-        try:
-            stat_info = os.stat(path)
-            mime_type, _ = mimetypes.guess_type(path)
-            
-            info = {
+
+        async def send_with_cors_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), *CORS_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors_headers)
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized straight to UTF-8 bytes with orjson"""
+
+    def render(self, content):
+        return orjson.dumps(content)
+
+# The manifest is static, so it is serialized once at import
+MANIFEST = {
+    "protocol": {
+        "schema": "mcp",
+        "version": "0.1.0"
+    },
+    "server": {
+        "name": "File Browser MCP Server",
+        "version": "1.0.0",
+        "description": "Browse and access files on the host system",
+        "vendor": "MCP Server Builder",
+        "host": f"{HOST}:{PORT}"
+    },
+    "tools": [
+        {
+            "name": "list_directory",
+            "description": "List files and directories in a specified path",
+            "parameters": [
+                {
+                    "name": "path",
+                    "description": "Directory path to list",
+                    "type": "string",
+                    "required": True
+                }
+            ]
+        },
+        {
+            "name": "read_file",
+            "description": "Read the contents of a file",
+            "parameters": [
+                {
+                    "name": "path",
+                    "description": "File path to read",
+                    "type": "string",
+                    "required": True
+                }
+            ]
+        },
+        {
+            "name": "get_file_info",
+            "description": "Get metadata about a file",
+            "parameters": [
+                {
+                    "name": "path",
+                    "description": "File path to analyze",
+                    "type": "string",
+                    "required": True
+                }
+            ]
+        }
+    ]
+}
+_MANIFEST_BYTES = orjson.dumps(MANIFEST)
+
+def _send_error(status_code, message):
+    """Return a plain-text error response"""
+    return PlainTextResponse(message, status_code=status_code)
+
+async def manifest(request):
+    """Handle GET requests - serves the MCP manifest"""
+    return Response(_MANIFEST_BYTES, media_type="application/json")
+
+async def call_tool(request):
+    """Handle POST requests - execute the requested tool"""
+    try:
+        params = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        return _send_error(400, "Invalid JSON")
+
+    tool_path = request.path_params["tool"].strip("/")
+
+    if tool_path == "list_directory":
+        return await _handle_list_directory(params)
+    elif tool_path == "read_file":
+        return await _handle_read_file(params)
+    elif tool_path == "get_file_info":
+        return await _handle_get_file_info(params)
+    else:
+        return _send_error(404, "Tool not found")
+
+@functools.lru_cache(maxsize=256)
+def _guess_mime(suffixes):
+    """Guess the MIME type and encoding for file suffixes such as .txt or .tar.gz"""
+    return mimetypes.guess_type("file" + suffixes)
+
+def _mime_suffixes(path):
+    """Return the suffix that decides a path's MIME type, keeping compound ones like .tar.gz"""
+    base, ext = os.path.splitext(path)
+    # Encoding suffixes (.gz, .bz2, .Z, ...) wrap the type suffix in front of them,
+    # and are matched case-sensitively, so they are kept as they are
+    if ext in mimetypes.encodings_map:
+        return os.path.splitext(base)[1].lower() + ext
+    return ext.lower()
+
+def _is_path_allowed(path):
+    """Check if the path is within allowed directories"""
+    # Resolve on every call: symlinks can change between requests
+    return os.path.join(os.path.realpath(path), "").startswith(_ALLOWED_REAL)
+
+def _printable(name):
+    """Replace undecodable filename bytes so the name can be serialized as JSON"""
+    return name.encode("utf-8", "surrogateescape").decode("utf-8", "replace")
+
+def _scan_directory(path):
+    """List a directory's entries with their type, size and modification time"""
+    result = []
+
+    # scandir entries carry the file type from the directory read, so
+    # only the size and mtime need a stat call per entry
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                stat_info = entry.stat()
+                entry_type = "directory" if entry.is_dir() else "file"
+
+                result.append({
+                    "name": _printable(entry.name),
+                    "type": entry_type,
+                    "size": stat_info.st_size,
+                    "modified": stat_info.st_mtime,
+                    "path": _printable(entry.path)
+                })
+            except OSError:
+                # Skip entries we can't access
+                pass
+
+    return result
+
+async def _handle_list_directory(params):
+    """Handle the list_directory tool"""
+    if "path" not in params:
+        return _send_error(400, "Path parameter is required")
+
+    path = params["path"]
+
+    if not _is_path_allowed(path):
+        return ORJSONResponse({
+            "error": "Path not allowed",
+            "allowed_dirs": ALLOWED_DIRS
+        })
+
+    try:
+        # Enumerate in a worker thread so a slow disk doesn't block the event loop
+        result = await asyncio.to_thread(_scan_directory, path)
+
+        return ORJSONResponse({
+            "path": path,
+            "entries": result,
+            "count": len(result)
+        })
+    except (FileNotFoundError, NotADirectoryError):
+        return ORJSONResponse({
+            "error": "Directory not found or not a directory",
+            "path": path
+        })
+    except PermissionError:
+        return ORJSONResponse({
+            "error": "Permission denied",
+            "path": path
+        })
+
+async def _stream_base64_content(f, envelope):
+    """Yield the JSON envelope with the file's base64 content encoded block by block"""
+    try:
+        # Splice the content field into the envelope ahead of its closing brace
+        yield envelope[:-1] + b',"content":"'
+        while block := await f.read(READ_BLOCK_SIZE):
+            yield base64.b64encode(block)
+        yield b'"}'
+    finally:
+        await f.close()
+
+async def _handle_read_file(params):
+    """Handle the read_file tool"""
+    if "path" not in params:
+        return _send_error(400, "Path parameter is required")
+
+    path = params["path"]
+
+    if not _is_path_allowed(path):
+        return ORJSONResponse({
+            "error": "Path not allowed",
+            "allowed_dirs": ALLOWED_DIRS
+        })
+
+    try:
+        # Check file size before reading
+        file_size = await aiofiles.os.path.getsize(path)
+        if file_size > MAX_FILE_SIZE:
+            return ORJSONResponse({
+                "error": "File too large to read",
                 "path": path,
-                "exists": True,
-                "is_file": os.path.isfile(path),
-                "is_dir": os.path.isdir(path),
-                "size": stat_info.st_size,
-                "created": stat_info.st_ctime,
-                "modified": stat_info.st_mtime,
-                "accessed": stat_info.st_atime,
-                "mime_type": mime_type
-            }
-            
-            self._set_headers()
-            self.wfile.write(json.dumps(info).encode())
-        except FileNotFoundError:
-            self._set_headers()
-            self.wfile.write(json.dumps({
+                "size": file_size,
+                "max_size": MAX_FILE_SIZE
+            })
+
+        mime_type, encoding = _guess_mime(_mime_suffixes(path))
+        # Compressed files (.gz, .bz2, ...) are binary whatever type they wrap
+        is_binary = encoding or (mime_type and not mime_type.startswith(('text/', 'application/json')))
+
+        if is_binary:
+            # For binary files, stream the base64 encoded content
+            f = await aiofiles.open(path, 'rb')
+            envelope = orjson.dumps({
                 "path": path,
-                "exists": False,
-                "error": "File not found"
-            }).encode())
-        except PermissionError:
-            self._set_headers()
-            self.wfile.write(json.dumps({
+                "content_type": mime_type or "application/octet-stream",
+                "encoding": "base64",
+                "size": file_size
+            })
+            return StreamingResponse(
+                _stream_base64_content(f, envelope),
+                media_type="application/json"
+            )
+        else:
+            # For text files, read the raw bytes and decode them once
+            async with aiofiles.open(path, 'rb') as f:
+                content = (await f.read()).decode('utf-8', errors='replace')
+            return ORJSONResponse({
                 "path": path,
-                "exists": True,
-                "error": "Permission denied"
-            }).encode())
+                "content_type": mime_type or "text/plain",
+                "encoding": "utf-8",
+                "size": file_size,
+                "content": content
+            })
+
+    except FileNotFoundError:
+        return ORJSONResponse({
+            "error": "File not found",
+            "path": path
+        })
+    except PermissionError:
+        return ORJSONResponse({
+            "error": "Permission denied",
+            "path": path
+        })
+    except IsADirectoryError:
+        return ORJSONResponse({
+            "error": "Path is a directory, not a file",
+            "path": path
+        })
+
+async def _handle_get_file_info(params):
+    """Handle the get_file_info tool"""
+    if "path" not in params:
+        return _send_error(400, "Path parameter is required")
+
+    path = params["path"]
+
+    if not _is_path_allowed(path):
+        return ORJSONResponse({
+            "error": "Path not allowed",
+            "allowed_dirs": ALLOWED_DIRS
+        })
+
+    try:
+        stat_info = await aiofiles.os.stat(path)
+        mime_type, _ = _guess_mime(_mime_suffixes(path))
+
+        info = {
+            "path": path,
+            "exists": True,
+            "is_file": stat.S_ISREG(stat_info.st_mode),
+            "is_dir": stat.S_ISDIR(stat_info.st_mode),
+            "size": stat_info.st_size,
+            "created": stat_info.st_ctime,
+            "modified": stat_info.st_mtime,
+            "accessed": stat_info.st_atime,
+            "mime_type": mime_type
+        }
+
+        return ORJSONResponse(info)
+    except FileNotFoundError:
+        return ORJSONResponse({
+            "path": path,
+            "exists": False,
+            "error": "File not found"
+        })
+    except PermissionError:
+        return ORJSONResponse({
+            "path": path,
+            "exists": True,
+            "error": "Permission denied"
+        })
+
+app = Starlette(
+    routes=[
+        Route("/", manifest, methods=["GET"]),
+        Route("/{tool:path}", call_tool, methods=["POST"]),
+    ],
+    middleware=[
+        Middleware(CORSHeadersMiddleware),
+    ],
+)
 
 def run_server():
     """Start the MCP server"""
-    server_address = (HOST, PORT)
-    httpd = HTTPServer(server_address, MCPServer)
     print(f"MCP File Browser Server running at http://{HOST}:{PORT}")
-    httpd.serve_forever()
+    # Worker processes import the app themselves, so it is passed as an import string
+    module_name = os.path.splitext(os.path.basename(__file__))[0]
+    uvicorn.run(
+        f"{module_name}:app",
+        host=HOST,
+        port=PORT,
+        timeout_keep_alive=KEEP_ALIVE_TIMEOUT,
+        workers=WORKERS
+    )
 
 if __name__ == "__main__":
-    run_server()
\ No newline at end of file
+    run_server()
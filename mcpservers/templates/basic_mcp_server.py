@@ -7,104 +7,154 @@ with a single example tool. Use this as a starting point for your own servers.
 """
 
 import os
-import json
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import parse_qs, urlparse
+
+import orjson  # You may need to install this: pip install orjson
+import uvicorn  # You may need to install this: pip install "uvicorn[standard]"
+from starlette.applications import Starlette  # You may need to install this: pip install starlette
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Route
 
 # Configuration
 HOST = os.environ.get("HOST", "0.0.0.0")
 PORT = int(os.environ.get("PORT", 8000))
+KEEP_ALIVE_TIMEOUT = int(os.environ.get("KEEP_ALIVE_TIMEOUT", 75))  # Seconds an idle connection stays open
+WORKERS = int(os.environ.get("WEB_CONCURRENCY", 1))  # Server processes
 
-class MCPServer(BaseHTTPRequestHandler):
-    def _set_headers(self, content_type="application/json"):
-        """Set common headers for responses"""
-        self.send_response(200)
-        self.send_header("Content-Type", content_type)
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
-        self.end_headers()
-
-    def do_OPTIONS(self):
-        """Handle preflight requests for CORS"""
-        self._set_headers()
-
-    def do_GET(self):
-        """Handle GET requests - serves the MCP manifest"""
-        if self.path == "/" or self.path == "":
-            self._set_headers()
-            manifest = {
-                "protocol": {
-                    "schema": "mcp",
-                    "version": "0.1.0"
-                },
-                "server": {
-                    "name": "Basic MCP Server in Python",
-                    "version": "1.0.0",
-                    "description": "A simple MCP server template written in Python",
-                    "vendor": "MCP Server Builder",
-                    "host": f"{HOST}:{PORT}"
-                },
-                "tools": [
-                    {
-                        "name": "hello_world",
-                        "description": "Return a greeting message",
-                        "parameters": [
-                            {
-                                "name": "name",
-                                "description": "Name to greet",
-                                "type": "string",
-                                "required": True
-                            }
-                        ]
-                    },
-                    # Add more tools here as needed
-                ]
-            }
-            self.wfile.write(json.dumps(manifest).encode())
-        else:
-            self.send_error(404, "Not Found")
-
-    def do_POST(self):
-        """Handle POST requests - execute the requested tool"""
-        content_length = int(self.headers["Content-Length"])
-        post_data = self.rfile.read(content_length).decode("utf-8")
-        
-        try:
-            params = json.loads(post_data)
-        except json.JSONDecodeError:
-            self.send_error(400, "Invalid JSON")
+# Headers added to every HTTP response
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET, POST, OPTIONS"),
+    (b"access-control-allow-headers", b"Content-Type"),
+]
+
+class CORSHeadersMiddleware:
+    """Pure ASGI middleware that answers preflight requests and adds CORS headers"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
             return
-        
-        tool_path = self.path.strip("/")
-        
-        if tool_path == "hello_world":
-            self._handle_hello_world(params)
-        else:
-            self.send_error(404, "Tool not found")
-    
-    def _handle_hello_world(self, params):
-        """Handle the hello_world tool"""
-        if "name" not in params:
-            self.send_error(400, "Name parameter is required")
+
+        if scope["method"] == "OPTIONS":
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", b"0"),
+                    *CORS_HEADERS
+                ]
+            })
+            await send({"type": "http.response.body", "body": b""})
             return
-        
-        name = params["name"]
-        
-        self._set_headers()
-        response = {
-            "message": f"Hello, {name}! Welcome to MCP.",
-            "timestamp": time.time()
-        }
-        self.wfile.write(json.dumps(response).encode())
+
+        async def send_with_cors_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), *CORS_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors_headers)
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized straight to UTF-8 bytes with orjson"""
+
+    def render(self, content):
+        return orjson.dumps(content)
+
+# The manifest is static, so it is serialized once at import
+MANIFEST = {
+    "protocol": {
+        "schema": "mcp",
+        "version": "0.1.0"
+    },
+    "server": {
+        "name": "Basic MCP Server in Python",
+        "version": "1.0.0",
+        "description": "A simple MCP server template written in Python",
+        "vendor": "MCP Server Builder",
+        "host": f"{HOST}:{PORT}"
+    },
+    "tools": [
+        {
+            "name": "hello_world",
+            "description": "Return a greeting message",
+            "parameters": [
+                {
+                    "name": "name",
+                    "description": "Name to greet",
+                    "type": "string",
+                    "required": True
+                }
+            ]
+        },
+        # Add more tools here as needed
+    ]
+}
+_MANIFEST_BYTES = orjson.dumps(MANIFEST)
+
+def _send_error(status_code, message):
+    """Return a plain-text error response"""
+    return PlainTextResponse(message, status_code=status_code)
+
+async def manifest(request):
+    """Handle GET requests - serves the MCP manifest"""
+    return Response(_MANIFEST_BYTES, media_type="application/json")
+
+async def call_tool(request):
+    """Handle POST requests - execute the requested tool"""
+    try:
+        params = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        return _send_error(400, "Invalid JSON")
+
+    tool_path = request.path_params["tool"].strip("/")
+
+    if tool_path == "hello_world":
+        return await _handle_hello_world(params)
+    else:
+        return _send_error(404, "Tool not found")
+
+async def _handle_hello_world(params):
+    """Handle the hello_world tool"""
+    if "name" not in params:
+        return _send_error(400, "Name parameter is required")
+
+    name = params["name"]
+
+    response = {
+        "message": f"Hello, {name}! Welcome to MCP.",
+        "timestamp": time.time()
+    }
+    return ORJSONResponse(response)
+
+app = Starlette(
+    routes=[
+        Route("/", manifest, methods=["GET"]),
+        Route("/{tool:path}", call_tool, methods=["POST"]),
+    ],
+    middleware=[
+        # Handle preflight requests for CORS
+        Middleware(CORSHeadersMiddleware),
+    ],
+)
 
 def run_server():
     """Start the MCP server"""
-    server_address = (HOST, PORT)
-    httpd = HTTPServer(server_address, MCPServer)
     print(f"MCP Server running at http://{HOST}:{PORT}")
-    httpd.serve_forever()
+    # Worker processes import the app themselves, so it is passed as an import string
+    module_name = os.path.splitext(os.path.basename(__file__))[0]
+    uvicorn.run(
+        f"{module_name}:app",
+        host=HOST,
+        port=PORT,
+        timeout_keep_alive=KEEP_ALIVE_TIMEOUT,
+        workers=WORKERS
+    )
 
 if __name__ == "__main__":
-    run_server()
\ No newline at end of file
+    run_server()
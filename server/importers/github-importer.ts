@@ -88,7 +88,7 @@ async function extractToolsFromPythonFile(filePath: string): Promise<Tool[]> {
     const tools: Tool[] = [];
     
     // Look for class-based parameter definitions
-    // Format: class ToolNameParams(BaseModel):
+    // Format: class ToolNameParams(BaseModel): or class ToolNameParams(msgspec.Struct, ...):
     const classMatches = content.matchAll(/class\s+([A-Za-z0-9_]+)_?[pP]arams\s*\([^)]*\):\s*([\s\S]*?)(?=class|\Z)/g);
     
     for (const match of Array.from(classMatches)) {
@@ -98,7 +98,10 @@ async function extractToolsFromPythonFile(filePath: string): Promise<Tool[]> {
       
       // Extract parameters from class body
       // Format: param_name: type = Field(description="...")
-      const paramMatches = classBody.matchAll(/([A-Za-z0-9_]+)\s*:\s*([A-Za-z0-9_]+)(?:\s*=\s*Field\((?:[^)]*description\s*=\s*"([^"]*)")?[^)]*\))?/g);
+      //     or: param_name: Annotated[type, msgspec.Meta(description="...")]
+      // Anchored to the start of a line with the type on the same line, so comments
+      // and block statements such as "try:" in the class body are not mistaken for fields
+      const paramMatches = classBody.matchAll(/^[ \t]*([A-Za-z0-9_]+)[ \t]*:[ \t]*(?:Annotated\[\s*)?([A-Za-z0-9_]+)(?:[^\n]*?(?:Field|Meta)\((?:[^)]*description\s*=\s*"([^"]*)")?[^)]*\))?/gm);
       
       for (const paramMatch of Array.from(paramMatches)) {
         const paramName = paramMatch[1];
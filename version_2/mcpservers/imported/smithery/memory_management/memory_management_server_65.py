@@ -7,11 +7,14 @@ This is an auto-generated implementation based on server metadata.
 In a real scenario, this would be the actual implementation from the source.
 """
 
-from flask import Flask, request, jsonify
-import json
 import os
 
-app = Flask(__name__)
+import fastjsonschema
+import orjson
+import uvicorn
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
 
 # MCP Protocol version
 MCP_PROTOCOL_VERSION = "0.1"
@@ -48,18 +51,41 @@ TOOLS = [
     }
 ]
 
+# TOOLS is static, so every tool's parameter validator is compiled once at load time
+_VALIDATORS = {t["name"]: fastjsonschema.compile(t["parameters"]) for t in TOOLS}
+
 def validate_parameters(tool, params):
     """Helper function to validate parameters against a tool's schema"""
-    schema = tool["parameters"]
-    errors = []
-    
-    # Check required parameters
-    for required in schema.get("required", []):
-        if required not in params:
-            errors.append(f"Missing required parameter: {required}")
+    try:
+        _VALIDATORS[tool["name"]](params)
+    except fastjsonschema.JsonSchemaException as error:
+        return [error.message]
     
-    return errors
+    return []
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized straight to UTF-8 bytes with orjson"""
+
+    def render(self, content):
+        return orjson.dumps(content)
+
 
+# The capabilities and info responses are static, so they are serialized once at load time
+_CAPS_BYTES = orjson.dumps({
+    "protocol": "mcp",
+    "version": MCP_PROTOCOL_VERSION,
+    "tools": TOOLS
+})
+
+_INFO_BYTES = orjson.dumps({
+    "name": "memory_management_server_65",
+    "description": "A memory management MCP server",
+    "version": "1.0.0",
+    "protocol": "mcp",
+    "protocol_version": MCP_PROTOCOL_VERSION,
+    "tools": [t["name"] for t in TOOLS]
+})
 
 async def handle_memory_management_tool_65_1(parameters):
     """Implementation for memory_management_tool_65_1"""
@@ -75,61 +101,61 @@ async def handle_memory_management_tool_65_2(parameters):
         "result": f"Processed {parameters['input']} with memory_management_tool_65_2"
     }
 
-@app.route("/mcp", methods=["GET", "POST"])
-def mcp_endpoint():
+# Tool definitions and implementations, keyed by tool name
+_TOOL_BY_NAME = {t["name"]: t for t in TOOLS}
+
+_HANDLERS = {
+    "memory_management_tool_65_1": handle_memory_management_tool_65_1,
+    "memory_management_tool_65_2": handle_memory_management_tool_65_2
+}
+
+async def mcp_endpoint(request):
     if request.method == "GET":
         # Return MCP capabilities
-        return jsonify({
-            "protocol": "mcp",
-            "version": MCP_PROTOCOL_VERSION,
-            "tools": TOOLS
-        })
+        return Response(_CAPS_BYTES, media_type="application/json")
     
     # Handle MCP request
     try:
-        request_data = request.json
+        request_data = orjson.loads(await request.body())
         
         # Validate MCP request format
         if not request_data or "tool" not in request_data or "parameters" not in request_data:
-            return jsonify({
+            return ORJSONResponse({
                 "error": "Invalid MCP request format"
-            }), 400
+            }, status_code=400)
         
         tool_name = request_data["tool"]
         parameters = request_data["parameters"]
         
         # Find the requested tool
-        tool = next((t for t in TOOLS if t["name"] == tool_name), None)
+        tool = _TOOL_BY_NAME.get(tool_name)
         
         if not tool:
-            return jsonify({
+            return ORJSONResponse({
                 "error": f"Tool not found: {tool_name}"
-            }), 404
+            }, status_code=404)
         
         # Validate parameters
         validation_errors = validate_parameters(tool, parameters)
         
         if validation_errors:
-            return jsonify({
+            return ORJSONResponse({
                 "error": "Parameter validation failed",
                 "details": validation_errors
-            }), 400
+            }, status_code=400)
         
         # Execute the appropriate tool
-        result = None
+        handler = _HANDLERS.get(tool_name)
         
-        if tool_name == "memory_management_tool_65_1":
-            result = await handle_memory_management_tool_65_1(parameters)
-        elif tool_name == "memory_management_tool_65_2":
-            result = await handle_memory_management_tool_65_2(parameters)
-        
-        else:
-            return jsonify({
+        if not handler:
+            return ORJSONResponse({
                 "error": f"Tool implementation missing: {tool_name}"
-            }), 500
+            }, status_code=500)
+        
+        result = await handler(parameters)
         
         # Return successful response
-        return jsonify({
+        return ORJSONResponse({
             "tool": tool_name,
             "result": result
         })
@@ -137,22 +163,29 @@ def mcp_endpoint():
     except Exception as error:
         print(f"MCP request error: {error}")
         
-        return jsonify({
+        return ORJSONResponse({
             "error": str(error) or "Internal server error"
-        }), 500
+        }, status_code=500)
 
-@app.route("/")
-def info():
+async def info(request):
     """Root endpoint for info"""
-    return jsonify({
-        "name": "memory_management_server_65",
-        "description": "A memory management MCP server",
-        "version": "1.0.0",
-        "protocol": "mcp",
-        "protocol_version": MCP_PROTOCOL_VERSION,
-        "tools": [t["name"] for t in TOOLS]
-    })
+    return Response(_INFO_BYTES, media_type="application/json")
+
+app = Starlette(routes=[
+    Route("/mcp", mcp_endpoint, methods=["GET", "POST"]),
+    Route("/", info),
+])
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 3000))
-    app.run(host="0.0.0.0", port=port)
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    keep_alive_timeout = int(os.environ.get("KEEP_ALIVE_TIMEOUT", 75))
+    # Worker processes import the app themselves, so it is passed as an import string
+    module_name = os.path.splitext(os.path.basename(__file__))[0]
+    uvicorn.run(
+        f"{module_name}:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        timeout_keep_alive=keep_alive_timeout
+    )